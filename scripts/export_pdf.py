@@ -11,19 +11,47 @@ Colors: Forest Green, Antique Cream, Gold accents
 """
 
 import argparse
+import hashlib
+import io
 import json
+import mimetypes
+import multiprocessing
+import os
 import re
+import shutil
+import tempfile
+import time
+import xml.etree.ElementTree as etree
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from html import escape
+from urllib.request import url2pathname
 
+# WeasyPrint is only checked when exporting (see _require_weasyprint), so the
+# entry and cache helpers can be imported, and tested, without it
 try:
-    from weasyprint import HTML
+    from weasyprint import CSS, HTML
 except Exception as e:
-    raise SystemExit(
-        "WeasyPrint is required. Install with: pip3 install weasyprint\n"
-        f"Import error: {e}"
-    )
+    HTML = URLFetcher = None
+    _WEASYPRINT_ERROR = e
+else:
+    _WEASYPRINT_ERROR = None
+
+    # The font configuration moved to weasyprint.text in WeasyPrint 53
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:
+        from weasyprint.fonts import FontConfiguration
+
+    # Newer WeasyPrint releases take URLFetcher instances, older ones a function
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:
+        from weasyprint import default_url_fetcher
+        URLFetcher = None
 
 try:
     import markdown
@@ -35,12 +63,90 @@ except Exception as e:
         f"Import error: {e}"
     )
 
+# Optional and opt-in with CHRONICLE_MARKDOWN=mistune (pip3 install mistune).
+# Several times faster than Python-Markdown, but not the same dialect: lists
+# need a blank line before them only in Python-Markdown, two-space nested
+# lists and mixed ordered/unordered items are grouped differently, and the
+# smart quotes are an approximation of smarty.
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
+# Optional, only needed for --chunked (pip3 install pypdf)
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 CONFIG_FILE = SKILL_DIR / "config.json"
 DEFAULT_DIARY_PATH = "memory/diary/"
 DEFAULT_OUTPUT_NAME = "Cami-Diary.pdf"
+CACHE_DIR = SKILL_DIR / ".cache" / "export_pdf"  # one subdirectory per diary
+CACHE_TMP_MAX_AGE = 3600  # seconds before an unfinished cache write is deleted
+USE_MISTUNE = mistune is not None and os.getenv("CHRONICLE_MARKDOWN") == "mistune"
+MARKDOWN_BACKEND = (
+    f"mistune-{mistune.__version__}" if USE_MISTUNE else f"python-markdown-{markdown.__version__}"
+)
+# Part of every cache key; bump whenever entry conversion output changes
+MD_EXT_VERSION = f"{MARKDOWN_BACKEND}+fenced+tables+sane+smarty+tablelayout+v2"
+PARALLEL_MIN_ENTRIES = 16  # below this, worker start-up costs more than it saves
+SPOOL_MAX_SIZE = 64 * 1024 * 1024  # HTML kept in memory before spilling to disk
+SPOOL_CHUNK_SIZE = 1024 * 1024
+NO_BREAK_MAX_ROWS = 12  # tables up to this many rows are kept on one page
+READ_AHEAD = 32  # files read on threads ahead of the entry being rendered
+CHUNK_ENTRIES = 50  # entries per separately rendered document with --chunked
+FRONT_MATTER_PASSES = 4  # renders of the --chunked cover and TOC at most
+
+# Patterns used on every entry, compiled once at import
+_TITLE_RE_1 = re.compile(r"^#\s*📔?\s*Cami'?s?\s*Diary\s*[-—–]\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+_TITLE_RE_2 = re.compile(r"^#\s+\d{4}-\d{2}-\d{2}\s*[—–-]\s*([^#\n]+)$", re.MULTILINE)
+_SUMMARY_RE = re.compile(r"##\s*Summary\s*\n+(.+?)(?:\n\n|\n##|\Z)", re.IGNORECASE | re.DOTALL)
+_HIGHLIGHT_RE = re.compile(r"##\s*🌟\s*Today'?s?\s*Highlight\s*\n+(.+?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL)
+_EMOJI_RE = re.compile(r"[\U0001F300-\U0001F9FF]")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_PUNCT_ONLY_RE = re.compile(r"^[\s—–-]*$")
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+# Same replacements as html.escape(), applied in a single translate() pass
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# One alternation over every section header the extractors care about, so an
+# entry is scanned once; each hit is then confirmed with its full pattern.
+_SECTION_RE = re.compile(
+    r"(?P<title1>^#\s*📔?\s*Cami'?s?\s*Diary\s*[-—–])"
+    r"|(?P<title2>^#\s+\d{4}-\d{2}-\d{2}\s*[—–-])"
+    r"|(?P<summary>##\s*Summary)"
+    r"|(?P<highlight>##\s*🌟\s*Today'?s?\s*Highlight)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_SECTION_BODY_RES = {
+    "title1": _TITLE_RE_1,
+    "title2": _TITLE_RE_2,
+    "summary": _SUMMARY_RE,
+    "highlight": _HIGHLIGHT_RE,
+}
+
+# Optional stylesheet blocks (see _CSS_BLOCKS) and the markup that needs them
+_CSS_FEATURE_MARKERS = {
+    "highlight": 'class="entry-highlight"',
+    "lists": "<li",
+    "blockquote": "<blockquote",
+    "hr": "<hr",
+    "code": "<code",
+    "pre": "<pre",
+    "table": "<table",
+}
 
 
 def load_config():
@@ -51,10 +157,9 @@ def load_config():
     return {"diary_path": DEFAULT_DIARY_PATH}
 
 
+@cache
 def get_workspace_root():
     """Find the workspace root"""
-    import os
-    
     # Check environment variable first
     env_workspace = os.getenv("OPENCLAW_WORKSPACE") or os.getenv("AGENT_WORKSPACE")
     if env_workspace:
@@ -82,37 +187,96 @@ def get_diary_path(config):
     return diary_path
 
 
+def _is_date_md(name: str) -> bool:
+    """True for entry file names of the form YYYY-MM-DD.md"""
+    return (
+        len(name) == 13
+        and name.endswith(".md")
+        and name[4] == "-"
+        and name[7] == "-"
+        and name[:4].isdigit()
+        and name[5:7].isdigit()
+        and name[8:10].isdigit()
+    )
+
+
 def load_entries(diary_path: Path):
     """Load and return sorted diary entries"""
-    md_files = sorted(diary_path.glob("*.md"))
-    dated = [f for f in md_files if re.match(r"\d{4}-\d{2}-\d{2}$", f.stem)]
-    return dated
+    try:
+        with os.scandir(diary_path) as it:
+            names = [e.name for e in it if _is_date_md(e.name)]
+    except OSError:
+        return []
+    # ISO dates sort chronologically as plain strings
+    names.sort()
+    return [diary_path / name for name in names]
+
+
+# English names, as strftime gives them in the C locale the script runs in
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _fast_parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD entry date by slicing (ValueError if invalid)"""
+    return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+
+def format_date_display(date_str: str) -> tuple[str, str, str]:
+    """Convert YYYY-MM-DD to beautiful date parts: (weekday, month day, year)"""
+    try:
+        dt = _fast_parse_date(date_str)
+        weekday = _WEEKDAYS[dt.weekday()]
+        month_day = f"{_MONTHS[dt.month - 1]} {dt.day:02d}"
+        year = str(dt.year)
+        return weekday, month_day, year
+    except:
+        return "", date_str, ""
+
+
+def _parse_entry(content: str, date_str: str) -> tuple[str, str | None]:
+    """Extract (title, highlight) from an entry in a single scan"""
+    found = {}
+    for header in _SECTION_RE.finditer(content):
+        kind = header.lastgroup
+        if kind in found:
+            continue
+        match = _SECTION_BODY_RES[kind].match(content, header.start())
+        if match:
+            found[kind] = match
+            if len(found) == len(_SECTION_BODY_RES):
+                break
 
+    return _title_from_matches(found, date_str), _highlight_from_match(found.get("highlight"))
 
-def parse_entry_title(content: str, date_str: str):
-    """Extract title from markdown content"""
+
+def _title_from_matches(found: dict, date_str: str) -> str:
+    """Pick the entry title from the parsed section matches"""
     # Try: # 📔 Cami's Diary - Saturday, January 31st, 2026
-    match = re.search(r"^#\s*📔?\s*Cami'?s?\s*Diary\s*[-—–]\s*(.+)$", content, re.MULTILINE | re.IGNORECASE)
+    match = found.get("title1")
     if match:
         title = match.group(1).strip()
         # Don't use if it's just the date repeated
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", title):
+        if not _DATE_RE.match(title):
             return title
     
     # Try: # YYYY-MM-DD — Title (with actual title after)
-    match = re.search(r"^#\s+\d{4}-\d{2}-\d{2}\s*[—–-]\s*([^#\n]+)$", content, re.MULTILINE)
+    match = found.get("title2")
     if match:
         title = match.group(1).strip()
         # Don't use if it's empty or just punctuation
-        if title and not re.match(r"^[\s—–-]*$", title):
+        if title and not _PUNCT_ONLY_RE.match(title):
             return title
     
     # Try: ## Summary section as fallback
-    match = re.search(r"##\s*Summary\s*\n+(.+?)(?:\n\n|\n##|\Z)", content, re.IGNORECASE | re.DOTALL)
+    match = found.get("summary")
     if match:
         summary = match.group(1).strip()
         # Get first sentence, truncate if needed
-        first_sentence = re.split(r'[.!?]', summary)[0].strip()
+        first_sentence = _SENTENCE_END_RE.split(summary, 1)[0].strip()
         if len(first_sentence) > 60:
             first_sentence = first_sentence[:57] + "..."
         if first_sentence:
@@ -120,54 +284,182 @@ def parse_entry_title(content: str, date_str: str):
     
     # Fallback to nicely formatted date
     try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.strftime("%A's Reflections")
+        dt = _fast_parse_date(date_str)
+        return f"{_WEEKDAYS[dt.weekday()]}'s Reflections"
     except:
         return "Journal Entry"
 
 
-def format_date_display(date_str: str) -> tuple[str, str, str]:
-    """Convert YYYY-MM-DD to beautiful date parts: (weekday, month day, year)"""
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        weekday = dt.strftime("%A")
-        month_day = dt.strftime("%B %d")
-        year = dt.strftime("%Y")
-        return weekday, month_day, year
-    except:
-        return "", date_str, ""
-
-
-def extract_quote_of_day(content: str) -> str | None:
-    """Extract quote of the day if present"""
-    # Look for ## Quote of the Day or similar
-    match = re.search(r"##\s*Quote.*?\n+>\s*(.+?)(?:\n\n|\Z)", content, re.IGNORECASE | re.DOTALL)
-    if match:
-        quote = match.group(1).strip()
-        # Clean up multiline quotes
-        quote = re.sub(r"\n>\s*", " ", quote)
-        return quote
-    return None
-
-
-def extract_highlight(content: str) -> str | None:
-    """Extract today's highlight if present"""
-    match = re.search(r"##\s*🌟\s*Today'?s?\s*Highlight\s*\n+(.+?)(?=\n##|\Z)", content, re.IGNORECASE | re.DOTALL)
+def _highlight_from_match(match) -> str | None:
+    """Clean up today's highlight if present"""
     if match:
         text = match.group(1).strip()
         # Get first paragraph only
         first_para = text.split("\n\n")[0]
         # Remove markdown formatting
-        first_para = re.sub(r"\*\*(.+?)\*\*", r"\1", first_para)
+        first_para = _BOLD_RE.sub(r"\1", first_para)
         if len(first_para) > 200:
             first_para = first_para[:197] + "..."
         return first_para
     return None
 
 
-def get_css():
-    """Return the beautiful CSS stylesheet"""
-    return """
+def _col_width(columns: int) -> str:
+    """Equal share of the table width for one of columns"""
+    return f"{100 / columns:.4g}%"
+
+
+class TableLayoutTreeprocessor(Treeprocessor):
+    """Give markdown tables explicit column widths and keep small ones whole"""
+
+    def run(self, root):
+        for table in root.iter("table"):
+            rows = list(table.iter("tr"))
+            if not rows:
+                continue
+
+            # Equal <col> widths so the fixed table layout never has to
+            # measure cell contents
+            columns = len(rows[0])
+            if columns:
+                colgroup = etree.Element("colgroup")
+                for _ in range(columns):
+                    etree.SubElement(colgroup, "col", style=f"width: {_col_width(columns)}")
+                table.insert(0, colgroup)
+
+            # Only small tables avoid page breaks; forcing it on long ones
+            # makes pagination retry the table on every page
+            if len(rows) <= NO_BREAK_MAX_ROWS:
+                table.set("class", "no-break")
+
+
+class TableLayoutExtension(Extension):
+    """Register TableLayoutTreeprocessor after inline processing"""
+
+    def extendMarkdown(self, md):
+        md.treeprocessors.register(TableLayoutTreeprocessor(md), "table_layout", 5)
+
+
+_SMART_PUNCTUATION = (("---", "—"), ("--", "–"), ("...", "…"))
+_OPEN_DOUBLE_QUOTE_RE = re.compile(r'(?<![^\s(\[{—–])"(?=\S)')
+_OPEN_SINGLE_QUOTE_RE = re.compile(r"(?<![^\s(\[{—–])'(?=\S)(?!\d\ds)")
+
+
+def _smarten(text: str, previous: str = "", following: str = "") -> str:
+    """Smart dashes, ellipses and quotes, like Python-Markdown's smarty
+
+    previous and following are the characters rendered either side of text
+    in the same block, so quotes next to inline markup open and close
+    the right way round.
+    """
+    for plain, smart in _SMART_PUNCTUATION:
+        text = text.replace(plain, smart)
+    # Each replacement is one character, so the context can be sliced off again
+    text = previous + text + following
+    text = _OPEN_DOUBLE_QUOTE_RE.sub("“", text).replace('"', "”")
+    text = _OPEN_SINGLE_QUOTE_RE.sub("‘", text).replace("'", "’")
+    return text[len(previous):len(text) - len(following)]
+
+
+# Tokens rendered inside a block; any other token starts a new block
+_INLINE_TOKENS = frozenset({
+    "text", "emphasis", "strong", "link", "image", "codespan",
+    "linebreak", "softbreak", "inline_html", "strikethrough",
+})
+
+
+def _leading_char(tokens, start: int = 0) -> str:
+    """First character tokens[start:] render as text"""
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token["type"] in ("linebreak", "softbreak"):
+            return "\n"
+        if "raw" in token:
+            char = token["raw"][:1]
+        else:
+            char = _leading_char(token.get("children", ()))
+        if char:
+            return char
+    return ""
+
+
+if mistune is not None:
+    class VelvetRenderer(mistune.HTMLRenderer):
+        """mistune renderer matching the Python-Markdown extension setup"""
+
+        # Characters rendered either side of the current text token, for
+        # _smarten; emphasis and link tags are transparent, so a quote
+        # after </em> follows the text inside
+        _previous = ""
+        _following = ""
+
+        def iter_tokens(self, tokens, state):
+            tokens = list(tokens)
+            outer = self._following
+            for i, token in enumerate(tokens):
+                self._following = _leading_char(tokens, i + 1) or outer
+                yield self.render_token(token, state)
+            self._following = outer
+
+        def render_token(self, token, state):
+            kind = token["type"]
+            if kind not in _INLINE_TOKENS:
+                self._previous = self._following = ""
+            html = super().render_token(token, state)
+            if kind == "codespan":
+                self._previous = token["raw"][-1:]
+            elif kind == "inline_html":
+                # smarty opens a quote after raw HTML
+                self._previous = ""
+            elif kind in ("linebreak", "softbreak"):
+                self._previous = "\n"
+            return html
+
+        def text(self, text):
+            text = _smarten(text, self._previous, self._following)
+            self._previous = text[-1:] or self._previous
+            return super().text(text)
+
+        def table(self, text):
+            # Same markup TableLayoutTreeprocessor adds
+            first_row = text.split("</tr>", 1)[0]
+            columns = first_row.count("</th>") + first_row.count("</td>")
+            colgroup = ""
+            if columns:
+                col = f'<col style="width: {_col_width(columns)}" />'
+                colgroup = f"<colgroup>{col * columns}</colgroup>\n"
+            rows = text.count("</tr>")
+            attrs = ' class="no-break"' if rows <= NO_BREAK_MAX_ROWS else ""
+            return f"<table{attrs}>\n{colgroup}{text}</table>\n"
+
+    def _create_mistune():
+        """mistune parser for entries; ~~text~~ stays literal, as in Python-Markdown"""
+        return mistune.create_markdown(renderer=VelvetRenderer(escape=False), plugins=["table"])
+
+
+if USE_MISTUNE:
+    # Built once per process and reused for every entry
+    _MD = _create_mistune()
+else:
+    # Built once per process; reset() between entries is much cheaper than
+    # registering every extension again for each markdown.markdown() call
+    _MD = markdown.Markdown(
+        extensions=["fenced_code", "tables", "sane_lists", "smarty", TableLayoutExtension()]
+    )
+
+
+def _markdown_to_html(content: str) -> str:
+    """Convert entry markdown with the configured backend"""
+    if USE_MISTUNE:
+        return _MD(content)
+    _MD.reset()
+    return _MD.convert(content)
+
+
+# The beautiful stylesheet: core rules plus optional blocks that are only
+# included when the document uses them, so WeasyPrint never matches unused
+# selectors.
+_CSS = """
     /* ===========================================
        VELVET EDITION - Editorial Magazine Style
        =========================================== */
@@ -456,6 +748,9 @@ def get_css():
         color: var(--forest-deep);
         margin: 0;
         letter-spacing: 1px;
+        /* PDF outline entry: "YYYY-MM-DD Title" instead of the bare date */
+        bookmark-level: 1;
+        bookmark-label: attr(data-title);
     }
     
     .entry-year {
@@ -476,23 +771,6 @@ def get_css():
         padding: 0 20px;
     }
     
-    .entry-highlight {
-        background: linear-gradient(135deg, var(--cream-warm) 0%, var(--cream) 100%);
-        border-left: 3px solid var(--gold);
-        padding: 15px 20px;
-        margin: 25px 0;
-        font-family: "TeX Gyre Bonum", "URW Bookman", serif;
-        font-size: 10.5pt;
-        font-style: italic;
-        color: var(--ink-light);
-        line-height: 1.6;
-    }
-    
-    .entry-highlight::before {
-        content: "✦ ";
-        color: var(--gold);
-    }
-    
     /* Entry Content Typography */
     .entry-content {
         text-align: justify;
@@ -558,6 +836,88 @@ def get_css():
         border-bottom: 1px solid var(--terracotta-light);
     }
     
+    /* Entry Footer */
+    .entry-footer {
+        margin-top: 40px;
+        padding-top: 20px;
+        border-top: 1px solid var(--cream-dark);
+        text-align: center;
+    }
+    
+    .entry-footer-ornament {
+        font-size: 10pt;
+        color: var(--gold);
+        letter-spacing: 6px;
+    }
+    
+    /* ===========================================
+       COLOPHON / END PAGE
+       =========================================== */
+    
+    .colophon {
+        page-break-before: always;
+        padding-top: 80mm;
+        text-align: center;
+    }
+    
+    .colophon-ornament {
+        font-size: 18pt;
+        color: var(--gold);
+        letter-spacing: 8px;
+        margin-bottom: 30px;
+    }
+    
+    .colophon-text {
+        font-family: "Lato", sans-serif;
+        font-size: 9pt;
+        font-weight: 300;
+        letter-spacing: 2px;
+        color: var(--ink-faded);
+        line-height: 2;
+    }
+    
+    .colophon-generated {
+        margin-top: 25px;
+        font-family: "Lato", sans-serif;
+        font-size: 8pt;
+        font-style: italic;
+        color: var(--ink-faded);
+    }
+    
+    /* ===========================================
+       PRINT UTILITIES
+       =========================================== */
+    
+    .page-break {
+        page-break-after: always;
+    }
+    
+    .no-break {
+        page-break-inside: avoid;
+        break-inside: avoid-page;
+    }
+"""
+
+_CSS_BLOCKS = {
+    "highlight": """
+    .entry-highlight {
+        background: linear-gradient(135deg, var(--cream-warm) 0%, var(--cream) 100%);
+        border-left: 3px solid var(--gold);
+        padding: 15px 20px;
+        margin: 25px 0;
+        font-family: "TeX Gyre Bonum", "URW Bookman", serif;
+        font-size: 10.5pt;
+        font-style: italic;
+        color: var(--ink-light);
+        line-height: 1.6;
+    }
+    
+    .entry-highlight::before {
+        content: "✦ ";
+        color: var(--gold);
+    }
+""",
+    "lists": """
     /* Lists */
     .entry-content ul, .entry-content ol {
         margin: 15px 0 15px 0;
@@ -577,7 +937,8 @@ def get_css():
         color: var(--forest-mid);
         font-weight: 600;
     }
-    
+""",
+    "blockquote": """
     /* Blockquotes */
     .entry-content blockquote {
         margin: 25px 0;
@@ -606,7 +967,8 @@ def get_css():
         margin: 0;
         text-indent: 0;
     }
-    
+""",
+    "hr": """
     /* Horizontal Rules */
     .entry-content hr {
         border: none;
@@ -620,7 +982,8 @@ def get_css():
         color: var(--gold);
         letter-spacing: 8px;
     }
-    
+""",
+    "code": """
     /* Code */
     .entry-content code {
         font-family: "Noto Sans Mono", "DejaVu Sans Mono", monospace;
@@ -630,7 +993,8 @@ def get_css():
         border-radius: 3px;
         color: var(--forest-mid);
     }
-    
+""",
+    "pre": """
     .entry-content pre {
         background: var(--forest-deep);
         color: var(--cream);
@@ -649,11 +1013,17 @@ def get_css():
         padding: 0;
         color: inherit;
     }
-    
-    /* Tables */
+""",
+    "table": """
+    /* Tables
+       Fixed layout with separate borders keeps WeasyPrint off its slow
+       column-measuring and collapsed-border paths. Tables are still the most
+       expensive thing to lay out, so prefer lists in diary entries. */
     .entry-content table {
         width: 100%;
-        border-collapse: collapse;
+        table-layout: fixed;
+        border-collapse: separate;
+        border-spacing: 0;
         margin: 20px 0;
         font-size: 9.5pt;
     }
@@ -677,169 +1047,317 @@ def get_css():
     .entry-content tr:nth-child(even) td {
         background: var(--cream-warm);
     }
-    
-    /* Entry Footer */
-    .entry-footer {
-        margin-top: 40px;
-        padding-top: 20px;
-        border-top: 1px solid var(--cream-dark);
-        text-align: center;
-    }
-    
-    .entry-footer-ornament {
-        font-size: 10pt;
-        color: var(--gold);
-        letter-spacing: 6px;
-    }
-    
-    /* ===========================================
-       COLOPHON / END PAGE
-       =========================================== */
-    
-    .colophon {
-        page-break-before: always;
-        padding-top: 80mm;
-        text-align: center;
-    }
-    
-    .colophon-ornament {
-        font-size: 18pt;
-        color: var(--gold);
-        letter-spacing: 8px;
-        margin-bottom: 30px;
-    }
-    
-    .colophon-text {
-        font-family: "Lato", sans-serif;
-        font-size: 9pt;
-        font-weight: 300;
-        letter-spacing: 2px;
-        color: var(--ink-faded);
-        line-height: 2;
-    }
-    
-    .colophon-generated {
-        margin-top: 25px;
-        font-family: "Lato", sans-serif;
-        font-size: 8pt;
-        font-style: italic;
-        color: var(--ink-faded);
-    }
-    
-    /* ===========================================
-       PRINT UTILITIES
-       =========================================== */
-    
-    .page-break {
-        page-break-after: always;
-    }
-    
-    .no-break {
-        page-break-inside: avoid;
-    }
+""",
+}
+
+
+def _convert_entry(job):
+    """Read and convert one (date_str, entry_path) job to (title_clean, highlight, html_body)"""
+    date_str, entry_path = job
+    return _convert_text(date_str, entry_path.read_text())
+
+
+def _convert_text(date_str: str, content: str):
+    """Convert an entry's markdown to (title_clean, highlight, html_body)"""
+    title, highlight = _parse_entry(content, date_str)
+    
+    # Clean title of emojis for TOC (keep it elegant)
+    title_clean = _EMOJI_RE.sub('', title).strip()
+    if not title_clean:
+        title_clean = title
+    
+    # Convert markdown to HTML
+    html_body = _markdown_to_html(content)
+    return title_clean, highlight, html_body
+
+
+def _render_toc_item(idx, date_str, title_html, page=None):
+    """TOC line for an entry, linking to it or, when page is given, listing
+    its page number instead"""
+    if page is None:
+        title = f'<a href="#entry-{idx}">{title_html}</a>'
+        page_html = ""
+    else:
+        title = title_html
+        page_html = f'\n            <span class="toc-page">{page}</span>'
+    return f'''
+        <li class="toc-item">
+            <span class="toc-date">{date_str}</span>
+            <span class="toc-entry-title">{title}</span>{page_html}
+        </li>
+    '''
+
+
+# Static pieces of an entry section, joined around the per-entry values
+_ENTRY_OPEN = '\n        <section class="entry" id="entry-'
+_ENTRY_WEEKDAY = (
+    '">\n'
+    '            <header class="entry-header">\n'
+    '                <div class="entry-date-ornament">◈</div>\n'
+    '                <div class="entry-weekday">'
+)
+_ENTRY_DATE = '</div>\n                <h1 class="entry-date-main" data-title="'
+_ENTRY_YEAR = '</h1>\n                <div class="entry-year">'
+_ENTRY_TITLE = '</div>\n                <div class="entry-title">'
+_ENTRY_HEADER_CLOSE = '</div>\n            </header>\n            \n            '
+_ENTRY_HIGHLIGHT_OPEN = '<div class="entry-highlight">'
+_ENTRY_CONTENT = '\n            \n            <div class="entry-content">\n                '
+_ENTRY_CLOSE = (
+    '\n            </div>\n'
+    '            \n'
+    '            <footer class="entry-footer">\n'
+    '                <div class="entry-footer-ornament">✦ ✦ ✦</div>\n'
+    '            </footer>\n'
+    '        </section>\n'
+    '    '
+)
+
+
+def _render_entry(idx, date_str, title_clean, highlight, html_body):
+    """Wrap a converted entry into its (title_html, section_html)"""
+    weekday, month_day, year = format_date_display(date_str)
+    title_html = title_clean.translate(_ESCAPE_TABLE)
+    
+    parts = [
+        _ENTRY_OPEN, str(idx),
+        _ENTRY_WEEKDAY, weekday,
+        _ENTRY_DATE, date_str, " ", title_html, '">', month_day,
+        _ENTRY_YEAR, year,
+        _ENTRY_TITLE, title_html,
+        _ENTRY_HEADER_CLOSE,
+    ]
+    # Highlight for the header area
+    if highlight:
+        parts += (_ENTRY_HIGHLIGHT_OPEN, highlight.translate(_ESCAPE_TABLE), "</div>")
+    parts += (_ENTRY_CONTENT, html_body, _ENTRY_CLOSE)
+    return title_html, "".join(parts)
+
+
+@cache
+def _diary_cache_name(diary_path: Path) -> str:
+    """Cache subdirectory of the diary at diary_path"""
+    return hashlib.blake2b(str(diary_path).encode(), digest_size=8).hexdigest()
+
+
+def _cache_key(entry_path: Path) -> str:
+    """Key a converted entry by path, modification time and markdown setup
+
+    Keys start with their diary's cache subdirectory, so pruning after one
+    diary's export never touches another diary's entries.
     """
+    stat = entry_path.stat()
+    raw = str(entry_path) + str(stat.st_mtime_ns) + MD_EXT_VERSION
+    return f"{_diary_cache_name(entry_path.parent)}/{hashlib.blake2b(raw.encode()).hexdigest()}"
 
 
-def build_html(entries):
-    """Build a beautifully designed HTML document"""
-    if not entries:
+def _cache_path(key: str) -> Path:
+    """Cache file holding the converted entry for key"""
+    return CACHE_DIR / f"{key}.json"
+
+
+def _load_cached(key: str):
+    """Return a cached (title_clean, highlight, html_body), or None on a miss"""
+    try:
+        title_clean, highlight, html_body = json.loads(_cache_path(key).read_text())
+    except Exception:
         return None
+    return title_clean, highlight, html_body
+
+
+def _store_cached(key: str, value):
+    """Best-effort write of a converted entry to the cache"""
+    try:
+        cache_path = _cache_path(key)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(value))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _prune_cache(keys):
+    """Delete cached conversions the diaries of keys no longer use
+
+    Keys change with every edit and MD_EXT_VERSION bump, so without this the
+    cache only ever grows. Temporary files older than CACHE_TMP_MAX_AGE, left
+    by interrupted writes, go as well; other diaries' caches are untouched.
+    """
+    keep = set(keys)
+    stale_before = time.time() - CACHE_TMP_MAX_AGE
+    for name in {key.partition("/")[0] for key in keys}:
+        try:
+            listing = os.scandir(CACHE_DIR / name)
+        except OSError:
+            continue
+        with listing:
+            for item in listing:
+                stem, _, suffix = item.name.partition(".")
+                try:
+                    if suffix == "json":
+                        if f"{name}/{stem}" not in keep:
+                            os.unlink(item.path)
+                    elif suffix.endswith(".tmp") and item.stat().st_mtime < stale_before:
+                        os.unlink(item.path)
+                except OSError:
+                    pass
 
+
+def _scan_features(html: str, features: set):
+    """Add the optional CSS blocks whose markup occurs in html to features"""
+    for name, marker in _CSS_FEATURE_MARKERS.items():
+        if name not in features and marker in html:
+            features.add(name)
+
+
+def _read_ahead(executor, fn, items):
+    """Like executor.map, but with at most READ_AHEAD calls in flight
+
+    Keeps a large diary's files from all being held in memory at once.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) == READ_AHEAD:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _spool_entries(entries, keys, misses, results, cached, spool):
+    """Render every entry into spool, in order
+
+    results yields the conversions for the indices in misses and cached the
+    _load_cached values for everything else, both in entry order. Returns
+    (toc_rows, features): the (date_str, title_html) of each entry and the
+    optional CSS blocks the written sections need.
+    """
+    toc_rows = [None] * len(entries)
+    features = set()
+    for i, entry_path in enumerate(entries):
+        date_str = entry_path.stem
+        if i in misses:
+            converted = next(results)
+            _store_cached(keys[i], converted)
+        else:
+            converted = next(cached)
+            if converted is None:  # unreadable cache file
+                converted = _convert_entry((date_str, entry_path))
+                _store_cached(keys[i], converted)
+
+        title_html, section = _render_entry(i + 1, date_str, *converted)
+        toc_rows[i] = (date_str, title_html)
+        spool.write(section)
+
+        # Only ship the optional CSS blocks whose markup actually occurs
+        _scan_features(section, features)
+    return toc_rows, features
+
+
+def _render_sections(entries, keys, spool, executor=None):
+    """Write every entry's section to spool; returns (toc_rows, features)
+
+    keys are the entries' _cache_key values. Conversions of unchanged entries
+    are reused from the cache. The rest are converted on executor, or on a
+    process pool of its own for large batches.
+    """
+    # Reuse conversions of unchanged entries; only stat them, don't read
+    misses = [i for i, key in enumerate(keys) if not _cache_path(key).exists()]
+
+    # Convert the rest (markdown is pure Python, so large batches fan out to
+    # worker processes; results come back in job order)
+    jobs = [(entries[i].stem, entries[i]) for i in misses]
+    miss_set = set(misses)
+    hits = [key for i, key in enumerate(keys) if i not in miss_set]
+    with ThreadPoolExecutor(max_workers=READ_AHEAD) as readers, ExitStack() as stack:
+        # Files read in this process are fetched on threads ahead of use;
+        # pool workers read their own entries
+        cached = _read_ahead(readers, _load_cached, hits)
+        if len(jobs) < PARALLEL_MIN_ENTRIES:
+            texts = _read_ahead(readers, Path.read_text, [entry_path for _, entry_path in jobs])
+            results = map(_convert_text, [date_str for date_str, _ in jobs], texts)
+        else:
+            if executor is None:
+                executor = stack.enter_context(_process_pool())
+            results = executor.map(_convert_entry, jobs, chunksize=8)
+        return _spool_entries(entries, keys, miss_set, results, cached, spool)
+
+
+def _process_pool():
+    """Worker process pool that never forks this (possibly threaded) process
+
+    Reader threads can already be running when the first job is submitted,
+    and a fork taken while they are can deadlock the worker, so workers come
+    from a forkserver (or are spawned where there is none).
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method))
+
+
+def _css_text(features) -> str:
+    """Return the stylesheet with the optional blocks named in features"""
+    return _CSS + "".join(css for name, css in _CSS_BLOCKS.items() if name in features)
+
+
+# Shared by every stylesheet and render in this process, so fontconfig lookups
+# for the Velvet font stacks are done once
+_FONT_CONFIG = FontConfiguration() if HTML is not None else None
+
+
+# Entries rendered as separate documents can't know their absolute page
+# numbers, so --chunked leaves the footers blank and numbers the TOC instead
+_CHUNK_CSS = """
+    @page {
+        @bottom-center { content: none; }
+    }
+"""
+
+
+@cache
+def _stylesheet(features: frozenset, chunked: bool = False):
+    """Return the parsed stylesheet for a feature set, parsed once per process"""
+    css = _css_text(features)
+    if chunked:
+        css += _CHUNK_CSS
+    return CSS(string=css, font_config=_FONT_CONFIG)
+
+
+def _html_head(css: str | None = None) -> str:
+    """Document start up to and including <body>, inlining css if given"""
+    head = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8" />
+    <title>Cami's Diary</title>
+'''
+    if css is not None:
+        head += f"    <style>\n{css}\n    </style>\n"
+    return head + "</head>\n<body>\n"
+
+
+def _cover_html(entries) -> str:
+    """Cover page with the diary's date range and entry count"""
     first_date = entries[0].stem
     last_date = entries[-1].stem
     
     # Format date range nicely
     try:
-        first_dt = datetime.strptime(first_date, "%Y-%m-%d")
-        last_dt = datetime.strptime(last_date, "%Y-%m-%d")
+        first_dt = _fast_parse_date(first_date)
+        last_dt = _fast_parse_date(last_date)
+        first_month = _MONTHS[first_dt.month - 1]
+        last_month = _MONTHS[last_dt.month - 1]
         if first_date == last_date:
-            date_range = first_dt.strftime("%B %d, %Y")
+            date_range = f"{first_month} {first_dt.day:02d}, {first_dt.year}"
         elif first_dt.year == last_dt.year:
-            date_range = f"{first_dt.strftime('%B %d')} – {last_dt.strftime('%B %d, %Y')}"
+            date_range = f"{first_month} {first_dt.day:02d} – {last_month} {last_dt.day:02d}, {last_dt.year}"
         else:
-            date_range = f"{first_dt.strftime('%B %Y')} – {last_dt.strftime('%B %Y')}"
+            date_range = f"{first_month} {first_dt.year} – {last_month} {last_dt.year}"
     except:
         date_range = f"{first_date} → {last_date}"
     
     entry_count = len(entries)
     
-    # Build TOC items
-    toc_items = []
-    entry_sections = []
-
-    for idx, entry_path in enumerate(entries, start=1):
-        date_str = entry_path.stem
-        content = entry_path.read_text()
-        title = parse_entry_title(content, date_str)
-        
-        # Clean title of emojis for TOC (keep it elegant)
-        title_clean = re.sub(r'[\U0001F300-\U0001F9FF]', '', title).strip()
-        if not title_clean:
-            title_clean = title
-        
-        anchor = f"entry-{idx}"
-        weekday, month_day, year = format_date_display(date_str)
-        
-        # TOC entry
-        toc_items.append(f'''
-            <li class="toc-item">
-                <span class="toc-date">{date_str}</span>
-                <span class="toc-entry-title"><a href="#{anchor}">{escape(title_clean)}</a></span>
-            </li>
-        ''')
-        
-        # Convert markdown to HTML
-        html_body = markdown.markdown(
-            content,
-            extensions=["fenced_code", "tables", "sane_lists", "smarty"]
-        )
-        
-        # Extract highlight for the header area
-        highlight = extract_highlight(content)
-        highlight_html = ""
-        if highlight:
-            highlight_html = f'<div class="entry-highlight">{escape(highlight)}</div>'
-        
-        # Build entry section
-        entry_sections.append(f'''
-            <section class="entry" id="{anchor}">
-                <header class="entry-header">
-                    <div class="entry-date-ornament">◈</div>
-                    <div class="entry-weekday">{weekday}</div>
-                    <h1 class="entry-date-main">{month_day}</h1>
-                    <div class="entry-year">{year}</div>
-                    <div class="entry-title">{escape(title_clean)}</div>
-                </header>
-                
-                {highlight_html}
-                
-                <div class="entry-content">
-                    {html_body}
-                </div>
-                
-                <footer class="entry-footer">
-                    <div class="entry-footer-ornament">✦ ✦ ✦</div>
-                </footer>
-            </section>
-        ''')
-
-    toc_html = "\n".join(toc_items)
-    entries_html = "\n".join(entry_sections)
-    
-    # Generation timestamp
-    generated = datetime.now().strftime("%B %d, %Y at %H:%M")
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8" />
-    <title>Cami's Diary</title>
-    <style>
-{get_css()}
-    </style>
-</head>
-<body>
-    <!-- ==================== COVER PAGE ==================== -->
+    return f'''    <!-- ==================== COVER PAGE ==================== -->
     <section class="cover">
         <div class="cover-ornament-top">◆ ◆ ◆</div>
         
@@ -856,7 +1374,18 @@ def build_html(entries):
         
         <div class="cover-ornament-bottom">◇ ◇ ◇</div>
     </section>
-    
+    '''
+
+
+def _toc_html(toc_rows, pages=None) -> str:
+    """Table of contents; entries are numbered from pages when given"""
+    if pages is None:
+        pages = [None] * len(toc_rows)
+    items = "".join(
+        _render_toc_item(i, date_str, title_html, page)
+        for i, ((date_str, title_html), page) in enumerate(zip(toc_rows, pages), 1)
+    )
+    return f'''
     <!-- ==================== TABLE OF CONTENTS ==================== -->
     <section class="toc">
         <header class="toc-header">
@@ -866,13 +1395,16 @@ def build_html(entries):
         </header>
         
         <ul class="toc-list">
-            {toc_html}
+{items}
         </ul>
     </section>
-    
-    <!-- ==================== DIARY ENTRIES ==================== -->
-    {entries_html}
-    
+'''
+
+
+def _colophon_html() -> str:
+    """Closing colophon stamped with the generation time"""
+    generated = datetime.now().strftime("%B %d, %Y at %H:%M")
+    return f'''
     <!-- ==================== COLOPHON ==================== -->
     <section class="colophon">
         <div class="colophon-ornament">◆ ◆ ◆</div>
@@ -884,38 +1416,298 @@ def build_html(entries):
             Generated on {generated}
         </div>
     </section>
-</body>
-</html>
 '''
 
-    return html
 
+_HTML_END = "</body>\n</html>\n"
+
+
+def _document_body(entries, toc_rows, sections):
+    """Yield everything after the <head>, in chunks
+
+    toc_rows and the entry sections spooled in sections come from
+    _render_sections.
+    """
+    yield _cover_html(entries)
+    yield _toc_html(toc_rows)
+    yield '''
+    <!-- ==================== DIARY ENTRIES ==================== -->
+'''
+    sections.seek(0)
+    while chunk := sections.read(SPOOL_CHUNK_SIZE):
+        yield chunk
+
+    yield _colophon_html()
+    yield _HTML_END
 
-def export_pdf(output_path: Path):
-    """Export diary entries to a beautiful PDF"""
-    config = load_config()
-    diary_path = get_diary_path(config)
-    entries = load_entries(diary_path)
 
+def _spool():
+    """Temporary text file for entry sections, kept in memory until large"""
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+", encoding="utf-8")
+
+
+def build_html(entries):
+    """Build a beautifully designed HTML document, yielded in chunks
+
+    Entry sections are spooled to a temporary file as they are rendered (the
+    TOC has to come first), so only one entry's markdown and HTML is held in
+    memory at a time. The stylesheet is inlined in a <style> block.
+    """
+    if not entries:
+        return
+
+    with _spool() as sections:
+        keys = [_cache_key(entry_path) for entry_path in entries]
+        toc_rows, features = _render_sections(entries, keys, sections)
+        yield _html_head(_css_text(features))
+        yield from _document_body(entries, toc_rows, sections)
+
+
+class _LocalResources(dict):
+    """Bytes and mime type of each local file one render references
+
+    A fresh instance comes with every url fetcher, so files are read once per
+    document and nothing outlives the render.
+    """
+
+    def __missing__(self, path: str) -> tuple[bytes, str]:
+        mime_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        resource = self[path] = (Path(path).read_bytes(), mime_type)
+        return resource
+
+
+def _file_url_path(url: str) -> str | None:
+    """Filesystem path of a file:// URL, or None for any other URL"""
+    if not url.startswith("file:"):
+        return None
+    return url2pathname(url.split("?", 1)[0].split("#", 1)[0].removeprefix("file:").removeprefix("//"))
+
+
+if URLFetcher is not None:
+    class CachingURLFetcher(URLFetcher):
+        """URL fetcher serving file:// resources from a per-render cache"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.resources = _LocalResources()
+
+        def fetch(self, url, headers=None):
+            path = _file_url_path(url)
+            if path is None:
+                return super().fetch(url, headers)
+            data, mime_type = self.resources[path]
+            return URLFetcherResponse(url, data, {"Content-Type": mime_type})
+
+    def _url_fetcher():
+        return CachingURLFetcher()
+else:
+    def _url_fetcher():
+        """url_fetcher serving file:// resources from a per-render cache"""
+        resources = _LocalResources()
+
+        def fetch(url):
+            path = _file_url_path(url)
+            if path is None:
+                return default_url_fetcher(url)
+            data, mime_type = resources[path]
+            return {"string": data, "mime_type": mime_type, "redirected_url": url}
+
+        return fetch
+
+
+def _render_pdf_from_html(html_file, output_path: Path, diary_path: Path, features):
+    """Render a UTF-8 HTML document from html_file to output_path"""
+    HTML(
+        file_obj=html_file,
+        base_url=str(diary_path),
+        encoding="utf-8",
+        url_fetcher=_url_fetcher(),
+    ).write_pdf(
+        str(output_path),
+        stylesheets=[_stylesheet(frozenset(features))],
+        font_config=_FONT_CONFIG,
+    )
+
+
+def _require_weasyprint():
+    """Exit with install instructions if WeasyPrint failed to import"""
+    if _WEASYPRINT_ERROR is not None:
+        raise SystemExit(
+            "WeasyPrint is required. Install with: pip3 install weasyprint\n"
+            f"Import error: {_WEASYPRINT_ERROR}"
+        )
+
+
+def export_pdf(output_path: Path, diary_path: Path, entries: list, html_path: Path | None = None):
+    """Export diary entries to a beautiful PDF
+
+    With html_path, the same document is also saved there as HTML, with the
+    stylesheet inlined so it opens on its own.
+    """
+    _require_weasyprint()
     if not entries:
         print(f"No diary entries found in {diary_path}")
         return False
 
-    html = build_html(entries)
-    if not html:
-        print("Failed to build HTML")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    keys = [_cache_key(entry_path) for entry_path in entries]
+    
+    # Stream the document into a spooled file instead of one big string.
+    # It is spooled as UTF-8 bytes, which every WeasyPrint parser accepts.
+    with _spool() as sections, tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as html_file:
+        toc_rows, features = _render_sections(entries, keys, sections)
+        head = _html_head().encode("utf-8")
+        html_file.write(head)
+        for chunk in _document_body(entries, toc_rows, sections):
+            html_file.write(chunk.encode("utf-8"))
+
+        if html_path is not None:
+            with open(html_path, "wb") as f:
+                f.write(_html_head(_css_text(features)).encode("utf-8"))
+                html_file.seek(len(head))
+                shutil.copyfileobj(html_file, f)
+            print(f"✓ Debug HTML saved to {html_path}")
+
+        html_file.seek(0)
+        _render_pdf_from_html(html_file, output_path, diary_path, features)
+    _prune_cache(keys)
+    print(f"✓ Exported PDF to {output_path}")
+    print(f"  {len(entries)} entries • Velvet Edition v1.0")
+    return True
+
+
+def _render_chunk(html: str, base_url: str, features: frozenset):
+    """Render one standalone document of a --chunked export
+
+    Returns (pdf_bytes, page_count, anchor_pages) where anchor_pages maps
+    each anchor to the 0-based page it is on.
+    """
+    document = HTML(string=html, base_url=base_url, url_fetcher=_url_fetcher()).render(
+        stylesheets=[_stylesheet(features, chunked=True)],
+        font_config=_FONT_CONFIG,
+    )
+    anchor_pages = {}
+    for number, page in enumerate(document.pages):
+        for anchor in page.anchors:
+            anchor_pages.setdefault(anchor, number)
+    return document.write_pdf(), len(document.pages), anchor_pages
+
+
+class _ChunkSpool:
+    """Stand-in spool for export_pdf_chunked
+
+    Groups written sections into documents of CHUNK_ENTRIES entries and
+    hands each one to submit(html, features) as soon as it is full.
+    """
+
+    def __init__(self, submit):
+        self.submit = submit
+        self.sections = []
+        self.futures = []
+
+    def write(self, section):
+        self.sections.append(section)
+        if len(self.sections) == CHUNK_ENTRIES:
+            self.flush()
+
+    def flush(self):
+        if not self.sections:
+            return
+        body = "".join(self.sections)
+        self.sections = []
+        features = set()
+        _scan_features(body, features)
+        html = _html_head() + body + _HTML_END
+        self.futures.append(self.submit(html, frozenset(features)))
+
+
+def _entry_pages(chunks, entry_count: int) -> list:
+    """0-based page of each entry, counted from the first entry page
+
+    chunks are the _render_chunk results of the entry documents, in order;
+    chunk c holds entries c * CHUNK_ENTRIES + 1 onwards.
+    """
+    entry_pages = []
+    offset = 0
+    for c, (_, page_count, anchor_pages) in enumerate(chunks):
+        first = c * CHUNK_ENTRIES + 1
+        last = min(first + CHUNK_ENTRIES, entry_count + 1)
+        entry_pages.extend(offset + anchor_pages[f"entry-{i}"] for i in range(first, last))
+        offset += page_count
+    return entry_pages
+
+
+def _merge_pdfs(parts, output_path: Path):
+    """Concatenate the PDFs of _render_chunk results, keeping their bookmarks"""
+    writer = pypdf.PdfWriter()
+    for pdf_bytes, _, _ in parts:
+        writer.append(io.BytesIO(pdf_bytes))
+    writer.add_metadata({"/Title": "Cami's Diary"})
+    writer.write(str(output_path))
+
+
+def export_pdf_chunked(output_path: Path, diary_path: Path, entries: list, html_path: Path | None = None):
+    """Export diary entries to a PDF rendered in parallel chunks
+
+    Layout cost grows faster than the document, so for very large diaries
+    rendering groups of entries in worker processes and merging the PDFs is
+    much quicker. The chunks are separate documents: entry pages carry no
+    printed page number and the TOC lists page numbers instead of links.
+
+    With html_path, the whole document is also built and saved there as HTML.
+    """
+    _require_weasyprint()
+    if pypdf is None:
+        raise SystemExit("pypdf is required for --chunked. Install with: pip3 install pypdf")
+
+    if not entries:
+        print(f"No diary entries found in {diary_path}")
         return False
 
+    # Chunked exports never build the whole document, so do it just for this
+    if html_path is not None:
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.writelines(build_html(entries))
+        print(f"✓ Debug HTML saved to {html_path}")
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Write HTML for debugging (optional)
-    # html_path = output_path.with_suffix('.html')
-    # html_path.write_text(html)
-    # print(f"✓ Debug HTML saved to {html_path}")
-    
-    HTML(string=html, base_url=str(diary_path)).write_pdf(str(output_path))
+    base_url = str(diary_path)
+    keys = [_cache_key(entry_path) for entry_path in entries]
+
+    with _process_pool() as ex:
+        def submit(html, features):
+            return ex.submit(_render_chunk, html, base_url, features)
+
+        spool = _ChunkSpool(submit)
+        toc_rows, _ = _render_sections(entries, keys, spool, executor=ex)
+        spool.flush()
+        back = submit(_html_head() + _colophon_html() + _HTML_END, frozenset())
+        chunks = [future.result() for future in spool.futures]
+        back = back.result()
+
+    entry_pages = _entry_pages(chunks, len(entries))
+
+    # The TOC's own length shifts every number, so settle it by re-rendering
+    # until the front matter's page count stops changing (usually twice)
+    front_count = 0
+    for _ in range(FRONT_MATTER_PASSES):
+        pages = [front_count + page + 1 for page in entry_pages]
+        html = _html_head() + _cover_html(entries) + _toc_html(toc_rows, pages) + _HTML_END
+        front = _render_chunk(html, base_url, frozenset())
+        if front[1] == front_count:
+            break
+        front_count = front[1]
+    else:
+        print(
+            f"  ⚠️  The cover and TOC did not settle after {FRONT_MATTER_PASSES} renders; "
+            "TOC page numbers may be off"
+        )
+
+    _merge_pdfs([front, *chunks, back], output_path)
+    _prune_cache(keys)
+
     print(f"✓ Exported PDF to {output_path}")
-    print(f"  {len(entries)} entries • Velvet Edition v1.0")
+    print(f"  {len(entries)} entries in {len(chunks)} chunks • Velvet Edition v1.0")
     return True
 
 
@@ -925,22 +1717,23 @@ def main():
     )
     parser.add_argument("--output", "-o", help="Output PDF path")
     parser.add_argument("--debug-html", action="store_true", help="Also save HTML for debugging")
+    parser.add_argument(
+        "--chunked", action="store_true",
+        help="Render entries in parallel chunks and merge them (faster for very large diaries, needs pypdf)"
+    )
     args = parser.parse_args()
 
     config = load_config()
     diary_path = get_diary_path(config)
+    entries = load_entries(diary_path)
 
     output_path = Path(args.output) if args.output else diary_path / DEFAULT_OUTPUT_NAME
+    html_path = output_path.with_suffix('.html') if args.debug_html else None
     
-    if args.debug_html:
-        entries = load_entries(diary_path)
-        if entries:
-            html = build_html(entries)
-            html_path = output_path.with_suffix('.html')
-            html_path.write_text(html)
-            print(f"✓ Debug HTML saved to {html_path}")
-    
-    export_pdf(output_path)
+    if args.chunked:
+        export_pdf_chunked(output_path, diary_path, entries, html_path)
+    else:
+        export_pdf(output_path, diary_path, entries, html_path)
 
 
 if __name__ == "__main__":
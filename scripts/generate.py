@@ -8,12 +8,16 @@ Decision Archaeology, and Relationship Evolution.
 """
 
 import argparse
+import asyncio
 import json
 import os
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import sys
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
@@ -25,19 +29,57 @@ DEFAULT_DIARY_PATH = "memory/diary/"
 # context gathering + persistence.
 AI_MAX_TOKENS = 2000
 
-
+# Marks a daily memory log that already has its chronicle
+_CHRONICLE_MARKER = "## 📜 Daily Chronicle".encode("utf-8")
+
+# Entry sections archived to persistent files:
+# (heading, filename, header for a new file, label)
+PERSISTENT_SECTIONS = [
+    ("Quote of the Day 💬", "quotes.md",
+     "# Quote Hall of Fame 💬\n\nMemorable quotes from my human.\n\n---\n\n", "quote"),
+    ("Things I'm Curious About 🔮", "curiosity.md",
+     "# Curiosity Backlog 🔮\n\nThings I want to explore.\n\n---\n\n## Active\n\n", "curiosities"),
+    ("Key Decisions Made 🏛️", "decisions.md",
+     "# Decision Archaeology 🏛️\n\nJudgment calls worth remembering.\n\n---\n\n", "decisions"),
+    ("Relationship Notes 🤝", "relationship.md",
+     "# Relationship Evolution 🤝\n\nHow my dynamic with my human evolves.\n\n---\n\n", "relationship notes"),
+]
+
+# Entry title line, and the break before each ## (or deeper) heading
+_TITLE_RE = re.compile(r'^# \d{4}-\d{2}-\d{2} — (.+)$', re.MULTILINE)
+_SECTION_SPLIT_RE = re.compile(r'\n(?=##)')
+
+
+def _freeze(value):
+    """Read-only copy of parsed JSON: objects become MappingProxyType, arrays tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json
+
+    Read once per process. The result is shared, so it is frozen all the way
+    down: objects are read-only mappings and arrays are tuples.
+    """
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
-    return {
+        with open(CONFIG_FILE, encoding="utf-8") as f:
+            config = json.load(f)
+        if not isinstance(config, dict):
+            raise SystemExit(f"{CONFIG_FILE} must contain a JSON object")
+        return _freeze(config)
+    return _freeze({
         "diary_path": DEFAULT_DIARY_PATH,
         "privacy_level": "private",
         "template": "daily"
-    }
+    })
 
 
+@lru_cache(maxsize=1)
 def get_workspace_root():
     """Find the workspace root (where memory/ lives)"""
     # Check environment variable first
@@ -61,52 +103,98 @@ def get_workspace_root():
 
 def get_diary_path(config):
     """Get full path to diary directory"""
-    workspace = get_workspace_root()
-    diary_path = workspace / config.get("diary_path", DEFAULT_DIARY_PATH)
+    return _diary_dir(config.get("diary_path", DEFAULT_DIARY_PATH))
+
+
+@lru_cache(maxsize=1)
+def _diary_dir(relative_path):
+    """Resolve and create the diary directory, once per configured path"""
+    diary_path = get_workspace_root() / relative_path
     diary_path.mkdir(parents=True, exist_ok=True)
     return diary_path
 
 
-def load_session_log(date_str, workspace):
+def _read_head(path, size):
+    """Read at most size characters from the start of a file"""
+    with open(path, encoding="utf-8") as f:
+        return f.read(size)
+
+
+@lru_cache(maxsize=1)
+def _aiofiles():
+    """aiofiles if installed (pip3 install aiofiles), else None
+
+    Imported on first use so commands that don't gather context skip it.
+    """
+    try:
+        import aiofiles
+    except ImportError:
+        return None
+    return aiofiles
+
+
+async def _read_texts(paths, limit):
+    """Read up to limit + 1 characters of each file, concurrently
+
+    Reads go through aiofiles when installed, else worker threads, so the
+    event loop never blocks. Only what fits in the context is read; a result
+    longer than limit means the file was truncated.
+    """
+    aiofiles = _aiofiles()
+
+    async def read(path):
+        if aiofiles is not None:
+            async with aiofiles.open(path, encoding="utf-8") as f:
+                return await f.read(limit + 1)
+        return await asyncio.to_thread(_read_head, path, limit + 1)
+
+    return await asyncio.gather(*(read(path) for path in paths))
+
+
+async def load_session_log(date_str, workspace):
     """Load session log for a specific date"""
     memory_dir = workspace / "memory"
     session_file = memory_dir / f"{date_str}.md"
     
     if session_file.exists():
-        with open(session_file) as f:
-            content = f.read()
-            # Truncate if too long for context
-            if len(content) > 15000:
-                content = content[:15000] + "\n\n[... truncated for context ...]"
-            return content
+        [content] = await _read_texts([session_file], 15000)
+        # Truncate if too long for context
+        if len(content) > 15000:
+            content = content[:15000] + "\n\n[... truncated for context ...]"
+        return content
     return None
 
 
-def load_recent_sessions(workspace, days=3):
+async def load_recent_sessions(workspace, days=3):
     """Load recent session logs for context"""
     memory_dir = workspace / "memory"
-    sessions = []
+    try:
+        with os.scandir(memory_dir) as it:
+            present = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return None
     
+    found = []
     for i in range(days):
         date = datetime.now() - timedelta(days=i)
         date_str = date.strftime("%Y-%m-%d")
-        session_file = memory_dir / f"{date_str}.md"
-        
-        if session_file.exists():
-            with open(session_file) as f:
-                content = f.read()
-                # Truncate individual sessions
-                if len(content) > 5000:
-                    content = content[:5000] + "\n[... truncated ...]"
-                sessions.append(f"## {date_str}\n{content}")
+        if f"{date_str}.md" in present:
+            found.append((date_str, memory_dir / f"{date_str}.md"))
+    
+    contents = await _read_texts([path for _, path in found], 5000)
+    sessions = []
+    for (date_str, _), content in zip(found, contents):
+        # Truncate individual sessions
+        if len(content) > 5000:
+            content = content[:5000] + "\n[... truncated ...]"
+        sessions.append(f"## {date_str}\n{content}")
     
     return "\n\n".join(sessions) if sessions else None
 
 
-def load_persistent_files(workspace):
+async def load_persistent_files(workspace):
     """Load Quote Hall of Fame, Curiosity Backlog, etc. for context"""
     diary_dir = workspace / "memory" / "diary"
-    files = {}
     
     persistent_files = [
         ("quotes", "quotes.md"),
@@ -114,19 +202,35 @@ def load_persistent_files(workspace):
         ("decisions", "decisions.md"),
         ("relationship", "relationship.md")
     ]
+    found = [
+        (key, diary_dir / filename)
+        for key, filename in persistent_files
+        if (diary_dir / filename).exists()
+    ]
     
-    for key, filename in persistent_files:
-        filepath = diary_dir / filename
-        if filepath.exists():
-            with open(filepath) as f:
-                content = f.read()
-                if len(content) > 2000:
-                    content = content[:2000] + "\n[... truncated ...]"
-                files[key] = content
+    contents = await _read_texts([path for _, path in found], 2000)
+    files = {}
+    for (key, _), content in zip(found, contents):
+        if len(content) > 2000:
+            content = content[:2000] + "\n[... truncated ...]"
+        files[key] = content
     
     return files
 
 
+async def _gather_context(date_str, workspace):
+    """Load today's log, recent sessions and persistent files concurrently
+
+    Gathering context is all file I/O, so the reads overlap instead of
+    queueing behind each other.
+    """
+    return await asyncio.gather(
+        load_session_log(date_str, workspace),
+        load_recent_sessions(workspace, days=2),
+        load_persistent_files(workspace),
+    )
+
+
 def build_generation_task(date_str: str, context: str) -> dict:
     """Return a portable generation payload for an OpenClaw sub-agent.
 
@@ -221,36 +325,31 @@ def generate_ai_diary(date_str, workspace, verbose=False, emit_task=False):
     """
 
     # Gather context
-    today_log = load_session_log(date_str, workspace)
-    recent_sessions = load_recent_sessions(workspace, days=2)
-    persistent_files = load_persistent_files(workspace)
+    today_log, recent_sessions, persistent_files = asyncio.run(
+        _gather_context(date_str, workspace)
+    )
 
     if not today_log and not recent_sessions:
         print(f"No session data found for {date_str} or recent days.")
         return None
 
-    # Build context section
-    context_parts = []
-
-    if today_log:
-        context_parts.append(f"## Today's Session Log ({date_str}):\n{today_log}")
-
-    if recent_sessions:
-        context_parts.append(f"## Recent Session Context:\n{recent_sessions}")
-
-    if persistent_files.get("quotes"):
-        context_parts.append(f"## Quote Hall of Fame (existing):\n{persistent_files['quotes']}")
-
-    if persistent_files.get("curiosity"):
-        context_parts.append(f"## Curiosity Backlog (existing):\n{persistent_files['curiosity']}")
-
-    if persistent_files.get("decisions"):
-        context_parts.append(f"## Decision Log (existing):\n{persistent_files['decisions']}")
-
-    if persistent_files.get("relationship"):
-        context_parts.append(f"## Relationship Notes (existing):\n{persistent_files['relationship']}")
+    # Build context section (one join, so the large bodies are copied once)
+    context_sections = [
+        (f"## Today's Session Log ({date_str}):\n", today_log),
+        ("## Recent Session Context:\n", recent_sessions),
+        ("## Quote Hall of Fame (existing):\n", persistent_files.get("quotes")),
+        ("## Curiosity Backlog (existing):\n", persistent_files.get("curiosity")),
+        ("## Decision Log (existing):\n", persistent_files.get("decisions")),
+        ("## Relationship Notes (existing):\n", persistent_files.get("relationship")),
+    ]
+    parts = []
+    for header, body in context_sections:
+        if body:
+            if parts:
+                parts.append("\n\n---\n\n")
+            parts += (header, body)
 
-    context = "\n\n---\n\n".join(context_parts)
+    context = "".join(parts)
 
     task = build_generation_task(date_str=date_str, context=context)
 
@@ -265,12 +364,28 @@ def generate_ai_diary(date_str, workspace, verbose=False, emit_task=False):
     return None
 
 
+def _split_sections(md: str) -> dict[str, str]:
+    """Map each ## heading of an entry to the text below it, in one pass
+
+    A section ends at the next heading of level 2 or deeper, so ### subsections
+    are left out: the persistent files use ### for their per-date records.
+    The first section with a given heading wins.
+    """
+    sections = {}
+    for part in _SECTION_SPLIT_RE.split(md):
+        if not part.startswith("## "):
+            continue
+        heading, _, body = part.partition("\n")
+        sections.setdefault(heading[3:].strip(), body)
+    return sections
+
+
 def extract_summary_from_entry(entry_content):
     """Extract summary section from diary entry for memory integration"""
     # Try to find Summary section
-    summary_match = re.search(r'## Summary\n(.+?)(?=\n##|\Z)', entry_content, re.DOTALL)
-    if summary_match:
-        return summary_match.group(1).strip()
+    summary = _split_sections(entry_content).get("Summary", "").strip()
+    if summary:
+        return summary
     
     # Fallback: first paragraph after title
     lines = entry_content.split('\n')
@@ -286,7 +401,7 @@ def extract_summary_from_entry(entry_content):
 
 def extract_title_from_entry(entry_content):
     """Extract title from diary entry"""
-    title_match = re.search(r'^# \d{4}-\d{2}-\d{2} — (.+)$', entry_content, re.MULTILINE)
+    title_match = _TITLE_RE.search(entry_content)
     if title_match:
         return title_match.group(1).strip()
     return None
@@ -303,8 +418,7 @@ def save_entry(content, date_str, diary_path, dry_run=False):
         print("-" * 50)
         return None
     
-    with open(output_file, 'w') as f:
-        f.write(content)
+    output_file.write_bytes(content.encode("utf-8"))
     
     print(f"✓ Saved diary entry to {output_file}")
     return output_file
@@ -346,20 +460,20 @@ def append_to_daily_memory(entry_content, date_str, config, workspace, dry_run=F
     # Create memory dir if needed
     memory_dir.mkdir(parents=True, exist_ok=True)
     
-    # Check if section already exists
-    if daily_memory_file.exists():
-        existing_content = daily_memory_file.read_text()
-        if "## 📜 Daily Chronicle" in existing_content:
+    # Check if section already exists; the session log keeps growing after
+    # the chronicle is added, so the whole file is searched
+    try:
+        existing = daily_memory_file.read_bytes()
+    except FileNotFoundError:
+        # Create new file with header
+        content = f"# {date_str}\n\n*Daily memory log*\n" + content
+    else:
+        if _CHRONICLE_MARKER in existing:
             print(f"  ℹ️  Daily Chronicle section already exists in {daily_memory_file}")
             return
-        # Append to existing file
-        with open(daily_memory_file, 'a') as f:
-            f.write(content)
-    else:
-        # Create new file with header
-        header = f"# {date_str}\n\n*Daily memory log*\n"
-        with open(daily_memory_file, 'w') as f:
-            f.write(header + content)
+    
+    with open(daily_memory_file, 'ab') as f:
+        f.write(content.encode("utf-8"))
     
     print(f"  ✓ Added chronicle to {daily_memory_file}")
 
@@ -368,58 +482,24 @@ def update_persistent_files(entry_content, date_str, workspace):
     """Extract and append quotes, curiosities, decisions to persistent files"""
     diary_dir = workspace / "memory" / "diary"
     diary_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(diary_dir) as it:
+        existing = {entry.name for entry in it}
     
-    # Extract Quote of the Day
-    quote_match = re.search(r'## Quote of the Day 💬\n(.+?)(?=\n##|\Z)', entry_content, re.DOTALL)
-    if quote_match:
-        quote_content = quote_match.group(1).strip()
-        if quote_content and len(quote_content) > 10:
-            quotes_file = diary_dir / "quotes.md"
-            if not quotes_file.exists():
-                quotes_file.write_text("# Quote Hall of Fame 💬\n\nMemorable quotes from my human.\n\n---\n\n")
-            
-            with open(quotes_file, 'a') as f:
-                f.write(f"\n### {date_str}\n{quote_content}\n")
-            print(f"  ✓ Added quote to {quotes_file}")
-    
-    # Extract Curiosities
-    curiosity_match = re.search(r'## Things I\'m Curious About 🔮\n(.+?)(?=\n##|\Z)', entry_content, re.DOTALL)
-    if curiosity_match:
-        curiosity_content = curiosity_match.group(1).strip()
-        if curiosity_content and len(curiosity_content) > 10:
-            curiosity_file = diary_dir / "curiosity.md"
-            if not curiosity_file.exists():
-                curiosity_file.write_text("# Curiosity Backlog 🔮\n\nThings I want to explore.\n\n---\n\n## Active\n\n")
-            
-            with open(curiosity_file, 'a') as f:
-                f.write(f"\n### {date_str}\n{curiosity_content}\n")
-            print(f"  ✓ Added curiosities to {curiosity_file}")
-    
-    # Extract Decisions
-    decisions_match = re.search(r'## Key Decisions Made 🏛️\n(.+?)(?=\n##|\Z)', entry_content, re.DOTALL)
-    if decisions_match:
-        decisions_content = decisions_match.group(1).strip()
-        if decisions_content and len(decisions_content) > 10:
-            decisions_file = diary_dir / "decisions.md"
-            if not decisions_file.exists():
-                decisions_file.write_text("# Decision Archaeology 🏛️\n\nJudgment calls worth remembering.\n\n---\n\n")
-            
-            with open(decisions_file, 'a') as f:
-                f.write(f"\n### {date_str}\n{decisions_content}\n")
-            print(f"  ✓ Added decisions to {decisions_file}")
-    
-    # Extract Relationship Notes
-    relationship_match = re.search(r'## Relationship Notes 🤝\n(.+?)(?=\n##|\Z)', entry_content, re.DOTALL)
-    if relationship_match:
-        relationship_content = relationship_match.group(1).strip()
-        if relationship_content and len(relationship_content) > 10:
-            relationship_file = diary_dir / "relationship.md"
-            if not relationship_file.exists():
-                relationship_file.write_text("# Relationship Evolution 🤝\n\nHow my dynamic with my human evolves.\n\n---\n\n")
-            
-            with open(relationship_file, 'a') as f:
-                f.write(f"\n### {date_str}\n{relationship_content}\n")
-            print(f"  ✓ Added relationship notes to {relationship_file}")
+    sections = _split_sections(entry_content)
+    
+    for heading, filename, header, label in PERSISTENT_SECTIONS:
+        section_content = sections.get(heading, "").strip()
+        if len(section_content) <= 10:
+            continue
+        
+        # New files get their header in the same write as the first entry
+        filepath = diary_dir / filename
+        payload = f"\n### {date_str}\n{section_content}\n"
+        if filename not in existing:
+            payload = header + payload
+        with open(filepath, 'a', encoding="utf-8") as f:
+            f.write(payload)
+        print(f"  ✓ Added {label} to {filepath}")
 
 
 def interactive_mode(date_str):
@@ -449,44 +529,24 @@ def interactive_mode(date_str):
         entry[key] = input(prompt) or ""
     
     # Build markdown from entry
-    content = f"""# {date_str} — {entry.get('title', 'Untitled')}
-
-## Summary
-{entry.get('summary', '')}
-
-## Projects Worked On
-{entry.get('projects', '')}
-
-## Wins 🎉
-{entry.get('wins', '')}
-
-## Frustrations 😤
-{entry.get('frustrations', '')}
-
-## Learnings 📚
-{entry.get('learnings', '')}
-
-## Emotional State
-{entry.get('emotional_state', '')}
-
-## Notable Interactions
-{entry.get('interactions', '')}
-
-## Quote of the Day 💬
-{entry.get('quotes', '')}
-
-## Things I'm Curious About 🔮
-{entry.get('curiosity', '')}
-
-## Key Decisions Made 🏛️
-{entry.get('decisions', '')}
-
-## Relationship Notes 🤝
-{entry.get('relationship', '')}
-
-## Tomorrow's Focus
-{entry.get('tomorrow', '')}
-"""
+    sections = [
+        ("Summary", "summary"),
+        ("Projects Worked On", "projects"),
+        ("Wins 🎉", "wins"),
+        ("Frustrations 😤", "frustrations"),
+        ("Learnings 📚", "learnings"),
+        ("Emotional State", "emotional_state"),
+        ("Notable Interactions", "interactions"),
+        ("Quote of the Day 💬", "quotes"),
+        ("Things I'm Curious About 🔮", "curiosity"),
+        ("Key Decisions Made 🏛️", "decisions"),
+        ("Relationship Notes 🤝", "relationship"),
+        ("Tomorrow's Focus", "tomorrow"),
+    ]
+    parts = [f"# {date_str} — {entry.get('title', 'Untitled')}\n"]
+    for heading, key in sections:
+        parts += ("\n## ", heading, "\n", entry.get(key, ""), "\n")
+    content = "".join(parts)
     
     return content
 
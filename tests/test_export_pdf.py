@@ -0,0 +1,165 @@
+"""Entry, cache and --chunked helpers of scripts/export_pdf.py"""
+
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import export_pdf  # noqa: E402  (imports without WeasyPrint)
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        patcher = mock.patch.object(export_pdf, "CACHE_DIR", self.root / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _diary(self, name, dates):
+        diary = self.root / name
+        diary.mkdir()
+        entries = []
+        for date_str in dates:
+            entry = diary / f"{date_str}.md"
+            entry.write_text(f"# {date_str} — Entry\n")
+            entries.append(entry)
+        return entries
+
+    def _export(self, entries):
+        """What an export does to the cache: store every entry, then prune"""
+        keys = [export_pdf._cache_key(entry) for entry in entries]
+        for key in keys:
+            export_pdf._store_cached(key, ["Title", None, "<p>body</p>"])
+        export_pdf._prune_cache(keys)
+        return keys
+
+    def test_store_and_load(self):
+        [entry] = self._diary("diary", ["2026-01-01"])
+        key = export_pdf._cache_key(entry)
+        self.assertIsNone(export_pdf._load_cached(key))
+        export_pdf._store_cached(key, ["Title", "Highlight", "<p>body</p>"])
+        self.assertEqual(export_pdf._load_cached(key), ("Title", "Highlight", "<p>body</p>"))
+
+    def test_key_changes_with_mtime(self):
+        [entry] = self._diary("diary", ["2026-01-01"])
+        key = export_pdf._cache_key(entry)
+        os.utime(entry, ns=(0, entry.stat().st_mtime_ns + 1_000_000_000))
+        self.assertNotEqual(export_pdf._cache_key(entry), key)
+
+    def test_prune_drops_stale_keys(self):
+        entries = self._diary("diary", ["2026-01-01", "2026-01-02"])
+        old_keys = self._export(entries)
+        os.utime(entries[0], ns=(0, entries[0].stat().st_mtime_ns + 1_000_000_000))
+        new_keys = self._export(entries)
+        self.assertFalse(export_pdf._cache_path(old_keys[0]).exists())
+        for key in new_keys:
+            self.assertTrue(export_pdf._cache_path(key).exists())
+
+    def test_other_diary_cache_survives(self):
+        keys_a = self._export(self._diary("a", ["2026-01-01", "2026-01-02"]))
+        self._export(self._diary("b", ["2026-02-01"]))
+        for key in keys_a:
+            self.assertTrue(export_pdf._cache_path(key).exists())
+
+    def test_prune_removes_old_tmp_files(self):
+        [key] = self._export(self._diary("diary", ["2026-01-01"]))
+        directory = export_pdf._cache_path(key).parent
+        old_tmp = directory / "abc.123.tmp"
+        new_tmp = directory / "def.456.tmp"
+        old_tmp.write_text("{")
+        new_tmp.write_text("{")
+        stale = time.time() - export_pdf.CACHE_TMP_MAX_AGE - 60
+        os.utime(old_tmp, (stale, stale))
+        export_pdf._prune_cache([key])
+        self.assertFalse(old_tmp.exists())
+        self.assertTrue(new_tmp.exists())
+
+
+class LoadEntriesTest(unittest.TestCase):
+    def test_only_dated_markdown_in_order(self):
+        names = [
+            "2026-01-02.md", "2026-01-01.md", "2025-12-31.md", "quotes.md",
+            "2026-1-01.md", "2026-01-01.txt", "2026-01-01.md.bak", "notes-2026-01-01.md",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            diary = Path(tmp)
+            for name in names:
+                (diary / name).write_text("x")
+            entries = export_pdf.load_entries(diary)
+            # Same selection as the original glob and regex
+            expected = [
+                f for f in sorted(diary.glob("*.md")) if re.match(r"\d{4}-\d{2}-\d{2}$", f.stem)
+            ]
+        self.assertEqual(entries, expected)
+        self.assertEqual([e.name for e in entries], ["2025-12-31.md", "2026-01-01.md", "2026-01-02.md"])
+
+    def test_missing_directory(self):
+        self.assertEqual(export_pdf.load_entries(Path("/nonexistent/diary")), [])
+
+
+class DateTest(unittest.TestCase):
+    def test_matches_strptime(self):
+        for date_str in ["2026-01-01", "2024-02-29", "1999-12-31", "2026-10-15"]:
+            with self.subTest(date_str=date_str):
+                dt = datetime.strptime(date_str, "%Y-%m-%d")
+                self.assertEqual(export_pdf._fast_parse_date(date_str), dt)
+                self.assertEqual(
+                    export_pdf.format_date_display(date_str),
+                    (dt.strftime("%A"), dt.strftime("%B %d"), dt.strftime("%Y")),
+                )
+
+    def test_invalid_dates(self):
+        for date_str in ["2026-02-30", "2026-13-01", "notadate!!"]:
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(ValueError):
+                    export_pdf._fast_parse_date(date_str)
+                self.assertEqual(export_pdf.format_date_display(date_str), ("", date_str, ""))
+
+
+class ChunkedTest(unittest.TestCase):
+    def test_entry_pages_across_chunks(self):
+        chunks = [
+            # An entry's own HTML may carry an id="entry-..." anchor too
+            (b"", 5, {"entry-9": 0, "entry-1": 0, "entry-2": 3}),
+            (b"", 4, {"entry-3": 0, "entry-4": 2}),
+            (b"", 1, {"entry-5": 0}),
+        ]
+        with mock.patch.object(export_pdf, "CHUNK_ENTRIES", 2):
+            self.assertEqual(export_pdf._entry_pages(chunks, 5), [0, 3, 5, 7, 9])
+
+    @unittest.skipIf(export_pdf.pypdf is None, "pypdf is not installed")
+    def test_merge_keeps_bookmarks(self):
+        pypdf = export_pdf.pypdf
+
+        def part(titles):
+            writer = pypdf.PdfWriter()
+            for page, title in enumerate(titles):
+                writer.add_blank_page(width=100, height=100)
+                writer.add_outline_item(title, page)
+            out = io.BytesIO()
+            writer.write(out)
+            return out.getvalue(), len(titles), {}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "merged.pdf"
+            export_pdf._merge_pdfs([part(["Cover"]), part(["2026-01-01 A", "2026-01-02 B"])], output)
+            reader = pypdf.PdfReader(output)
+            bookmarks = [
+                (item.title, reader.get_destination_page_number(item)) for item in reader.outline
+            ]
+            self.assertEqual(len(reader.pages), 3)
+            self.assertEqual(reader.metadata.title, "Cami's Diary")
+        self.assertEqual(bookmarks, [("Cover", 0), ("2026-01-01 A", 1), ("2026-01-02 B", 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
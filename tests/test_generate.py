@@ -0,0 +1,122 @@
+"""Context gathering and persistence helpers of scripts/generate.py"""
+
+import asyncio
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import generate  # noqa: E402
+
+ENTRY = """# 2026-03-04 — A Day of Choices
+
+## Summary
+Shipped the export.
+
+## Key Decisions Made 🏛️
+Chose forkserver workers.
+### Context
+More context here
+
+## Quote of the Day 💬
+> "Keep it simple."
+### Why it stuck
+It did.
+"""
+
+
+class LoadersTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.workspace = Path(tmp.name)
+        memory = self.workspace / "memory"
+        (memory / "diary").mkdir(parents=True)
+        today = datetime.now()
+        self.today = today.strftime("%Y-%m-%d")
+        self.yesterday = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        (memory / f"{self.today}.md").write_text("ü" * 20000, encoding="utf-8")
+        (memory / f"{self.yesterday}.md").write_text("short log ✨", encoding="utf-8")
+        (memory / "diary" / "quotes.md").write_text("q" * 3000, encoding="utf-8")
+        (memory / "diary" / "decisions.md").write_text("decided", encoding="utf-8")
+
+    def _check_loaders(self):
+        today_log, recent, persistent = asyncio.run(
+            generate._gather_context(self.today, self.workspace)
+        )
+        self.assertEqual(today_log, "ü" * 15000 + "\n\n[... truncated for context ...]")
+        self.assertEqual(
+            recent,
+            f"## {self.today}\n" + "ü" * 5000 + "\n[... truncated ...]"
+            f"\n\n## {self.yesterday}\nshort log ✨",
+        )
+        self.assertEqual(
+            persistent, {"quotes": "q" * 2000 + "\n[... truncated ...]", "decisions": "decided"}
+        )
+        self.assertIsNone(asyncio.run(generate.load_session_log("1999-01-01", self.workspace)))
+
+    @unittest.skipIf(generate._aiofiles() is None, "aiofiles is not installed")
+    def test_with_aiofiles(self):
+        self._check_loaders()
+
+    def test_with_threads(self):
+        with mock.patch.object(generate, "_aiofiles", return_value=None):
+            self._check_loaders()
+
+
+class SplitSectionsTest(unittest.TestCase):
+    def test_subsections_end_the_section(self):
+        sections = generate._split_sections(ENTRY)
+        self.assertEqual(sections["Summary"], "Shipped the export.\n")
+        self.assertEqual(sections["Key Decisions Made 🏛️"], "Chose forkserver workers.")
+        self.assertEqual(sections["Quote of the Day 💬"], '> "Keep it simple."')
+        self.assertNotIn("Context", sections)
+
+    def test_empty_section_does_not_take_the_next(self):
+        sections = generate._split_sections("## Summary\n## Quote of the Day 💬\n> q\n")
+        self.assertEqual(sections["Summary"], "")
+        self.assertEqual(generate.extract_summary_from_entry("# T\nfirst line\n## Summary\n"), "first line")
+
+    def test_persistent_files_skip_subsections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            with redirect_stdout(io.StringIO()):
+                generate.update_persistent_files(ENTRY, "2026-03-04", workspace)
+            diary_dir = workspace / "memory" / "diary"
+            decisions = (diary_dir / "decisions.md").read_text(encoding="utf-8")
+            quotes = (diary_dir / "quotes.md").read_text(encoding="utf-8")
+        self.assertIn("### 2026-03-04\nChose forkserver workers.", decisions)
+        self.assertNotIn("### Context", decisions)
+        self.assertNotIn("### Why it stuck", quotes)
+        self.assertEqual(decisions.count("### "), 1)
+
+
+class DailyMemoryTest(unittest.TestCase):
+    CONFIG = {"memory_integration": {"enabled": True, "append_to_daily": True, "format": "summary"}}
+
+    def _append(self, workspace):
+        with redirect_stdout(io.StringIO()):
+            generate.append_to_daily_memory(ENTRY, "2026-03-04", self.CONFIG, workspace)
+
+    def test_chronicle_added_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            self._append(workspace)
+            log = workspace / "memory" / "2026-03-04.md"
+            # The session log keeps growing well past the chronicle
+            with open(log, "a", encoding="utf-8") as f:
+                f.write("session notes ✨\n" * 10000)
+            self._append(workspace)
+            content = log.read_text(encoding="utf-8")
+        self.assertEqual(content.count("## 📜 Daily Chronicle"), 1)
+        self.assertTrue(content.startswith("# 2026-03-04\n"))
+        self.assertIn("Shipped the export.", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
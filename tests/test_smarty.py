@@ -0,0 +1,68 @@
+"""mistune smartening must match Python-Markdown's smarty extension"""
+
+import html
+import re
+import sys
+import unittest
+from pathlib import Path
+
+import markdown
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import export_pdf  # noqa: E402  (imports without WeasyPrint)
+
+if export_pdf.mistune is None:
+    raise unittest.SkipTest("mistune is not installed")
+
+# The opt-in backend (CHRONICLE_MARKDOWN=mistune), whatever the environment
+_mistune_to_html = export_pdf._create_mistune()
+
+_SMART_RE = re.compile(r"[‘’“”–—…]")
+
+# Python-Markdown output is the reference for these
+SAME_AS_PYTHON_MARKDOWN = [
+    "**Bold**'s",
+    "[Bob](x)'s",
+    "`ls`'s",
+    "- *x*'s",
+    "| a | b |\n|---|---|\n| \"c\" | *d*'s |",
+    '"Hello," she said.',
+    "It's 'quoted' -- right... ---",
+    'line one\n"two"',
+    '("paren")',
+    '> "quote"',
+    '# "Head"',
+    "the '90s",
+    '<b>x</b>"y"',
+    "~~x~~'s",
+]
+
+# smarty opens every quote that directly follows inline markup; these close
+QUOTE_AFTER_MARKUP = {
+    'She wrote "*really*"': ["“", "”"],
+    'a "`code`"': ["“", "”"],
+    "'*a*'": ["‘", "’"],
+}
+
+
+def _smart_chars(rendered: str) -> list:
+    return _SMART_RE.findall(html.unescape(rendered))
+
+
+class SmartyTest(unittest.TestCase):
+    def test_matches_python_markdown(self):
+        for text in SAME_AS_PYTHON_MARKDOWN:
+            with self.subTest(text=text):
+                expected = markdown.markdown(text, extensions=["tables", "sane_lists", "smarty"])
+                self.assertEqual(
+                    _smart_chars(_mistune_to_html(text)), _smart_chars(expected)
+                )
+
+    def test_quote_after_markup_closes(self):
+        for text, expected in QUOTE_AFTER_MARKUP.items():
+            with self.subTest(text=text):
+                self.assertEqual(_smart_chars(_mistune_to_html(text)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()